@@ -4,6 +4,8 @@ Main application for Claude chat extraction
 Orchestrates all modules to fetch and format chat data
 """
 
+from collections import defaultdict
+
 from app import curl_file
 from app import curl_parser
 from app import api_client
@@ -14,17 +16,13 @@ def main():
     """Main application entry point"""
     print("=== Claude Chat Extractor (Modular Version) ===\n")
     
-    # Check if cURL file exists and is configured
-    if not curl_file.check_curl_file_exists():
+    # Read cURL command from file once, then check it exists and is configured
+    curl_text = curl_file.load_curl_file()
+    if curl_text is None or not curl_file.is_configured(curl_text):
         print("No curl_command.txt found or not configured.")
         curl_file.create_sample_curl_file()
         return
     
-    # Read cURL command from file
-    curl_text = curl_file.read_curl_file()
-    if not curl_text:
-        return
-    
     # Parse cURL command
     curl_args = curl_parser.parse_curl_command(curl_text)
     if not curl_args:
@@ -56,36 +54,36 @@ def main():
     
     
     cur_dt = data_formatter.get_current_CST_timestamp()
-    conversations = {}
+    conversations = defaultdict(list)
     last_convo = None
 
 
-    for chat in formatted_chats: 
-    
-        chat_obj = {}
+    # * GET MESSAGE DATA (one cURL process for all chats), STRUCTURES MESSAGES
+    uuids = [chat.uuid for chat in formatted_chats]
+    # * each response is reduced to its message list as soon as it is decoded
+    msg_lists_by_uuid = api_client.fetch_many(uuids, curl_args, validation['org_id'], messages_from_response)
+    msg_lists = [msg_lists_by_uuid[uuid] for uuid in uuids]
 
-        chat_obj['name'] = chat['name']
-        chat_obj['uuid'] = chat['uuid']
-        # * GET MESSAGE DATA, STRUCTURES MESSAGES
-        chat_obj['msg_list'] = generate_message_list_from_uuid(chat['uuid'])
-        chat_obj['arch_dt'] = cur_dt
-        chat_obj['create_dt'] = chat['created_at']
-        chat_obj['update_dt'] = chat['updated_at']
-        chat_obj['file_name'] = f'{chat['bucket']}_{chat['name']}'
 
-        bucket = chat['bucket']
-        dict_key_exists = conversations.get(bucket)
+    for chat, msg_list in zip(formatted_chats, msg_lists): 
+    
+        chat_obj = {
+            'name': chat.name,
+            'uuid': chat.uuid,
+            'msg_list': msg_list,
+            'arch_dt': cur_dt,
+            'create_dt': chat.created_at,
+            'update_dt': chat.updated_at,
+            'file_name': f'{chat.bucket}_{chat.name}'
+        }
 
         if chat_obj['uuid'] == last_convo_uuid:
             last_convo = chat_obj 
 
-        if not dict_key_exists: 
-            conversations[bucket] = [chat_obj]
-        else:
-            conversations[bucket].append(chat_obj)
+        conversations[chat.bucket].append(chat_obj)
 
 
-    convos = build_master_object(last_convo, conversations)   
+    convos = build_master_object(last_convo, dict(conversations))   
 
 
     
@@ -95,9 +93,7 @@ def main():
     
 
 
-def generate_message_list_from_uuid(uuid): 
-
-    data = api_client.extract_messages(uuid)
+def messages_from_response(uuid, data): 
 
     if not data:
         print(f'No data found in uuid: {uuid}')
@@ -4,12 +4,39 @@ API client module
 Handles executing cURL commands and returning raw JSON data
 """
 
+import os
 import subprocess
 import json
 import re
+import tempfile
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
+# limit= query parameter, compiled once at import
+_LIMIT_RE = re.compile(r'limit=\d+')
+
+# Appended to stdout by curl so the HTTP status can be read without
+# scanning stderr; the marker separates it from the response body
+_HTTP_CODE_MARKER = b'\n__HTTP__'
+_HTTP_CODE_WRITE_OUT = '\\n__HTTP__%{http_code}'
+
+# Concurrent transfers inside the single cURL process used by fetch_many
+PARALLEL_MAX = 16
+
+# curl exits with 2 (failed to initialize) on an unknown option; --parallel
+# needs curl 7.66 and --no-progress-meter 7.67, so older versions stop here
+_CURL_UNKNOWN_OPTION = 2
+
+
+def _loads(raw):
+    """Decode a JSON response, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 def execute_curl_command(curl_args):
     """
@@ -23,37 +50,56 @@ def execute_curl_command(curl_args):
     """
     try:
         print("Executing cURL command...")
-        result = subprocess.run(curl_args, capture_output=True, text=True)
-        
-        if result.returncode != 0:
-            error_msg = f"cURL failed with return code {result.returncode}"
+        # Keep stdout as bytes; the JSON decoder reads them directly
+        # curl appends the HTTP status after the body via --write-out,
+        # and -sS keeps the progress meter out of stderr but not errors
+        result = subprocess.run(curl_args + ['-sS', '-w', _HTTP_CODE_WRITE_OUT], capture_output=True)
+        
+        body, marker, http_code = result.stdout.rpartition(_HTTP_CODE_MARKER)
+        if not marker:
+            body, http_code = result.stdout, b''
+        status = int(http_code) if http_code.isdigit() else None
+        
+        if result.returncode != 0 or (status is not None and status >= 400):
+            if result.returncode != 0:
+                error_msg = f"cURL failed with return code {result.returncode}"
+            else:
+                error_msg = f"Request failed with HTTP status {status}"
             
             # Check for common issues
-            if "403" in result.stderr or "Forbidden" in result.stderr:
+            if status == 403:
                 error_msg += "\n❌ Authentication failed (403 Forbidden)"
                 error_msg += "\nYour session may have expired. Please get a fresh cURL command."
-            elif "404" in result.stderr:
+            elif status == 404:
                 error_msg += "\n❌ API endpoint not found (404)"
                 error_msg += "\nCheck if the URL in your cURL command is correct."
+            elif status == 429:
+                error_msg += "\n❌ Rate limited (429 Too Many Requests)"
+                error_msg += "\nWait a few minutes before running again."
             
-            return {
+            error = {
                 'success': False,
-                'error': error_msg,
-                'stderr': result.stderr
+                'error': error_msg
             }
+            # curl only writes to stderr when it fails itself; an HTTP
+            # error status alone leaves it empty
+            if result.returncode != 0:
+                error['stderr'] = result.stderr.decode(errors='replace')
+            return error
         
         # Parse JSON response
         try:
-            data = json.loads(result.stdout)
+            data = _loads(body)
             return {
                 'success': True,
                 'data': data
             }
         except json.JSONDecodeError as e:
+            raw_response = body[:200].decode(errors='replace')
             return {
                 'success': False,
                 'error': f"Failed to parse response as JSON: {e}",
-                'raw_response': result.stdout[:200] + "..." if len(result.stdout) > 200 else result.stdout
+                'raw_response': raw_response + "..." if len(body) > 200 else raw_response
             }
             
     except Exception as e:
@@ -62,38 +108,40 @@ def execute_curl_command(curl_args):
             'error': f"Error executing cURL command: {e}"
         }
 
-def test_curl_command(curl_args):
+def _with_limit(curl_args, limit):
     """
-    Test cURL command with a quick request
-    
-    Args:
-        curl_args (list): Parsed cURL arguments
-        
-    Returns:
-        dict: Test results
+    Return cURL arguments whose chat_conversations URL requests `limit` results
+    Only the URL slot is rebuilt; the other arguments are shared, not copied
     """
-    # Modify args for a quick test (limit=1)
-    test_args = curl_args.copy()
-    
-    # Find and modify the URL to limit results
-    for i, arg in enumerate(test_args):
+    for i, arg in enumerate(curl_args):
         if 'chat_conversations' in arg:
             # Replace or add limit parameter
             if '?' in arg:
                 if 'limit=' in arg:
                     # Replace existing limit
-                    import re
-                    test_args[i] = re.sub(r'limit=\d+', 'limit=1', arg)
+                    new_arg = _LIMIT_RE.sub(f'limit={limit}', arg)
                 else:
                     # Add limit parameter
-                    test_args[i] = arg + '&limit=1'
+                    new_arg = arg + f'&limit={limit}'
             else:
                 # Add query params
-                test_args[i] = arg + '?limit=1'
-            break
+                new_arg = arg + f'?limit={limit}'
+            return curl_args[:i] + [new_arg] + curl_args[i + 1:]
     
+    return curl_args
+
+def test_curl_command(curl_args):
+    """
+    Test cURL command with a quick request
+    
+    Args:
+        curl_args (list): Parsed cURL arguments
+        
+    Returns:
+        dict: Test results
+    """
     print("Testing cURL command with limit=1...")
-    return execute_curl_command(test_args)
+    return execute_curl_command(_with_limit(curl_args, 1))
 
 def get_chat_conversations(curl_args, limit=100):
     """
@@ -106,94 +154,81 @@ def get_chat_conversations(curl_args, limit=100):
     Returns:
         dict: API response
     """
-    # Modify args to set the desired limit
-    modified_args = curl_args.copy()
-    
-    # Find and modify the URL to set limit
-    for i, arg in enumerate(modified_args):
-        if 'chat_conversations' in arg:
-            # Replace or add limit parameter
-            if '?' in arg:
-                if 'limit=' in arg:
-                    # Replace existing limit
-                    import re
-                    modified_args[i] = re.sub(r'limit=\d+', f'limit={limit}', arg)
-                else:
-                    # Add limit parameter
-                    modified_args[i] = arg + f'&limit={limit}'
-            else:
-                # Add query params
-                modified_args[i] = arg + f'?limit={limit}'
-            break
-    
-    return execute_curl_command(modified_args)
+    return execute_curl_command(_with_limit(curl_args, limit))
 
-def build_messages_curl(chat_uuid, base_curl_file='curl_command.txt'):
-    """
-    Build cURL command for fetching messages from a specific chat
-    Uses the authentication from the base cURL file but changes the endpoint
-    """
-    try:
-        # Read the base cURL command
-        with open(base_curl_file, 'r') as f:
-            base_curl = f.read().strip()
-        
-        # Extract organization ID from the base curl
-        org_match = re.search(r'/organizations/([a-f0-9-]+)/', base_curl)
-        if not org_match:
-            raise Exception("Could not find organization ID in base cURL")
-        
-        org_id = org_match.group(1)
-        
-        # Build the new URL for messages
-        messages_url = f"https://claude.ai/api/organizations/{org_id}/chat_conversations/{chat_uuid}?tree=True&rendering_mode=messages&render_all_tools=true"
-        
-        # Replace the URL in the base cURL
-        # Handle multi-line format
-        base_curl = base_curl.replace(' \\\n', ' ').replace('\\\n', ' ')
-        
-        # Find and replace the URL
-        url_pattern = r"curl '([^']+)'"
-        new_curl = re.sub(url_pattern, f"curl '{messages_url}'", base_curl)
-        
-        return new_curl
-        
-    except Exception as e:
-        print(f"Error building messages cURL: {e}")
-        return None
+def _messages_url_for(org_id, chat_uuid):
+    """Build the API URL that returns every message of a chat"""
+    return f"https://claude.ai/api/organizations/{org_id}/chat_conversations/{chat_uuid}?tree=True&rendering_mode=messages&render_all_tools=true"
 
-def extract_messages(chat_uuid):
-    """Extract all messages from a specific chat"""
-    
-    # Build cURL command for messages
-    curl_text = build_messages_curl(chat_uuid)
-    if not curl_text:
-        return None
-    
-    # Parse cURL command (same logic as our curl_parser)
-    curl_command = curl_text.replace(' \\\n', ' ').replace('\\\n', ' ')
-    if curl_command.startswith('curl '):
-        curl_command = curl_command[5:]
+def fetch_many(chat_uuids, curl_args, org_id, handle_response):
+    """
+    Fetch the messages of several chats with a single cURL process
+    Transfers run in parallel, so process startup is paid once instead of
+    per chat. Over HTTP/2 they share one connection and one TLS handshake;
+    over HTTP/1.1 curl may open up to PARALLEL_MAX connections
     
-    import shlex
-    args = shlex.split(curl_command)
-    curl_args = ['curl'] + args
+    Args:
+        chat_uuids (list): UUIDs of the chats to fetch
+        curl_args (list): Parsed and validated base cURL arguments
+        org_id (str): Organization ID from the base cURL URL
+        handle_response (callable): handler(uuid, data) applied to each
+            response as it is decoded, with data None where the fetch failed;
+            only its result is kept, so at most one full response is held in
+            memory at a time
+        
+    Returns:
+        dict: chat uuid -> handler result
+    """
+    if not chat_uuids:
+        return {}
     
-    print(f"Fetching messages for chat: {chat_uuid}")
+    # Options (headers, cookies, ...) apply to every URL that follows;
+    # the base URL itself sits in slot 1, right after 'curl'
+    option_args = curl_args[2:]
     
-    try:
-        # Execute cURL command
-        result = subprocess.run(curl_args, capture_output=True, text=True)
-        
-        if result.returncode != 0:
-            print(f"cURL failed: {result.stderr}")
-            return None
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # One '-o <file> <url>' triple per chat
+        output_args = []
+        for chat_uuid in chat_uuids:
+            output_args += ['-o', os.path.join(tmp_dir, f'{chat_uuid}.json'), _messages_url_for(org_id, chat_uuid)]
         
-        # Parse JSON response
-        data = json.loads(result.stdout)
+        # Keep stderr to errors only: -sS silences the per-transfer meter and
+        # --no-progress-meter the table --parallel prints even under -s.
+        # --fail writes no file for a 4xx/5xx response, so an expired
+        # session or a rate limit maps to None instead of being parsed as data
+        fetch_args = ['curl', '-sS', '--fail', '--no-progress-meter', '--parallel', '--parallel-max', str(PARALLEL_MAX)] + option_args + output_args
         
-        return data
+        print(f"Fetching messages for {len(chat_uuids)} chats...")
         
-    except Exception as e:
-        print(f"Error extracting messages: {e}")
-        return None
+        try:
+            result = subprocess.run(fetch_args, capture_output=True)
+            
+            if result.returncode == _CURL_UNKNOWN_OPTION:
+                print("This cURL is older than 7.67 and cannot fetch in parallel; fetching one chat at a time...")
+                for i in range(0, len(output_args), 3):
+                    result = subprocess.run(['curl', '-sS', '--fail'] + option_args + output_args[i:i + 3], capture_output=True)
+                    if result.returncode != 0:
+                        print(f"cURL failed: {result.stderr.decode(errors='replace')}")
+            elif result.returncode != 0:
+                # A failed transfer does not stop the others; report and keep going
+                print(f"cURL failed: {result.stderr.decode(errors='replace')}")
+        except Exception as e:
+            print(f"Error extracting messages: {e}")
+            return {chat_uuid: handle_response(chat_uuid, None) for chat_uuid in chat_uuids}
+        
+        # Each response landed in its own file; parse them one by one
+        results = {}
+        for chat_uuid in chat_uuids:
+            try:
+                with open(os.path.join(tmp_dir, f'{chat_uuid}.json'), 'rb') as f:
+                    data = _loads(f.read())
+            except FileNotFoundError:
+                print(f"No response saved for chat {chat_uuid}")
+                data = None
+            except (OSError, ValueError) as e:
+                print(f"Error extracting messages for chat {chat_uuid}: {e}")
+                data = None
+            
+            results[chat_uuid] = handle_response(chat_uuid, data)
+    
+    return results
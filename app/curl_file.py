@@ -4,6 +4,40 @@ cURL file handling module
 Manages reading/writing curl_command.txt and provides help instructions
 """
 
+import re
+
+# Placeholders that only appear in the generated sample file
+_PLACEHOLDER_RE = re.compile(r'YOUR_ORG_ID|YOUR_COOKIES_HERE')
+
+def load_curl_file(filename='curl_command.txt'):
+    """
+    Load the raw contents of the cURL command file
+    
+    Args:
+        filename (str): Path to cURL command file
+        
+    Returns:
+        str: File contents with surrounding whitespace stripped
+        None: if the file does not exist
+    """
+    try:
+        with open(filename, 'r') as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        return None
+
+def is_configured(content):
+    """
+    Check that cURL file contents are a real command, not the sample
+    
+    Args:
+        content (str): Contents of the cURL command file
+        
+    Returns:
+        bool: True if configured, False otherwise
+    """
+    return _PLACEHOLDER_RE.search(content) is None
+
 def read_curl_file(filename='curl_command.txt'):
     """
     Read cURL command from file
@@ -16,20 +50,19 @@ def read_curl_file(filename='curl_command.txt'):
         None: if file not found or error
     """
     try:
-        with open(filename, 'r') as f:
-            content = f.read().strip()
+        content = load_curl_file(filename)
+        if content is None:
+            print(f"Error: {filename} not found!")
+            print_help_instructions()
+            return None
         
         # Check if it's still the sample file
-        if 'YOUR_ORG_ID' in content or 'YOUR_COOKIES_HERE' in content:
+        if not is_configured(content):
             print("Please edit curl_command.txt with your actual cURL command.")
             return None
             
         return content
         
-    except FileNotFoundError:
-        print(f"Error: {filename} not found!")
-        print_help_instructions()
-        return None
     except Exception as e:
         print(f"Error reading {filename}: {e}")
         return None
@@ -101,15 +134,5 @@ def check_curl_file_exists(filename='curl_command.txt'):
     Returns:
         bool: True if file exists and configured, False otherwise
     """
-    try:
-        with open(filename, 'r') as f:
-            content = f.read().strip()
-            
-        # Check if it's still the sample file
-        if 'YOUR_ORG_ID' in content or 'YOUR_COOKIES_HERE' in content:
-            return False
-            
-        return True
-        
-    except FileNotFoundError:
-        return False
\ No newline at end of file
+    content = load_curl_file(filename)
+    return content is not None and is_configured(content)
\ No newline at end of file
@@ -4,8 +4,100 @@ cURL command parser module
 Handles parsing cURL commands into subprocess arguments
 """
 
-import shlex
 import re
+from urllib.parse import urlsplit
+
+# Backslash line continuation plus the next line's indentation
+_CONT_RE = re.compile(r'\\\r?\n[ \t]*')
+
+# Tokenizer pieces: unquoted runs, and the stops inside double quotes
+_BARE_RE = re.compile(r'[^ \t\r\n\'"\\]+')
+_DOUBLE_QUOTE_STOP_RE = re.compile(r'["\\]')
+_WHITESPACE = ' \t\r\n'
+
+def join_continuations(curl_text):
+    """
+    Join a multi-line cURL command into one line in a single pass
+    
+    Args:
+        curl_text (str): cURL command text with backslash continuations
+        
+    Returns:
+        str: The command on one line
+    """
+    return _CONT_RE.sub(' ', curl_text)
+
+def _split_curl(command):
+    """
+    Split a command line into arguments the way shlex.split does
+    
+    Copied cURL commands are mostly long quoted runs, so quoted text is
+    sliced out with str.find / regex search instead of char-by-char
+    
+    Args:
+        command (str): Command line with continuations already joined
+        
+    Returns:
+        list: Arguments with quoting removed
+    """
+    args = []
+    parts = []
+    in_token = False
+    i = 0
+    n = len(command)
+    
+    while i < n:
+        ch = command[i]
+        
+        if ch in _WHITESPACE:
+            if in_token:
+                args.append(''.join(parts))
+                parts = []
+                in_token = False
+            i += 1
+            continue
+        
+        in_token = True
+        
+        if ch == "'":
+            # Single quotes: everything up to the next quote is literal
+            end = command.find("'", i + 1)
+            if end == -1:
+                raise ValueError("No closing quotation")
+            parts.append(command[i + 1:end])
+            i = end + 1
+        elif ch == '"':
+            # Double quotes: backslash only escapes a quote or a backslash
+            i += 1
+            while True:
+                stop = _DOUBLE_QUOTE_STOP_RE.search(command, i)
+                if not stop:
+                    raise ValueError("No closing quotation")
+                if stop.end() == n and stop.group() == '\\':
+                    raise ValueError("No escaped character")
+                pos = stop.start()
+                parts.append(command[i:pos])
+                if stop.group() == '"':
+                    i = pos + 1
+                    break
+                escaped = command[pos + 1]
+                parts.append(escaped if escaped in '"\\' else '\\' + escaped)
+                i = pos + 2
+        elif ch == '\\':
+            # Backslash outside quotes takes the next character literally
+            if i + 1 == n:
+                raise ValueError("No escaped character")
+            parts.append(command[i + 1])
+            i += 2
+        else:
+            match = _BARE_RE.match(command, i)
+            parts.append(match.group())
+            i = match.end()
+    
+    if in_token:
+        args.append(''.join(parts))
+    
+    return args
 
 def parse_curl_command(curl_text):
     """
@@ -20,19 +112,13 @@ def parse_curl_command(curl_text):
     """
     try:
         # Handle multi-line cURL with backslash continuation
-        # Remove backslashes and join lines
-        curl_command = curl_text.replace(' \\\n', ' ').replace('\\\n', ' ')
-        
-        # Remove 'curl' from the beginning if present
-        if curl_command.startswith('curl '):
-            curl_command = curl_command[5:]
+        curl_command = join_continuations(curl_text)
         
-        # Use shlex to properly parse the command line
-        # This handles quoted arguments correctly
-        args = shlex.split(curl_command)
-        
-        # Add 'curl' back to the beginning
-        curl_args = ['curl'] + args
+        # Split into arguments, honoring shell quoting
+        # A leading 'curl' comes through as argv[0]; add it only if missing
+        curl_args = _split_curl(curl_command)
+        if not curl_args or curl_args[0] != 'curl':
+            curl_args.insert(0, 'curl')
         
         return curl_args
         
@@ -65,10 +151,13 @@ def extract_org_id(url):
     Returns:
         str: Organization ID or None
     """
-    org_match = re.search(r'/organizations/([a-f0-9-]+)/', url)
-    if org_match:
-        return org_match.group(1)
-    return None
+    # Path looks like /api/organizations/<org_id>/...
+    segments = urlsplit(url).path.split('/')
+    try:
+        org_id = segments[segments.index('organizations') + 1]
+    except (ValueError, IndexError):
+        return None
+    return org_id or None
 
 def validate_curl_command(curl_args):
     """
@@ -4,12 +4,41 @@ Data formatting module
 Handles timestamp formatting and data transformation
 """
 
+from collections import ChainMap, namedtuple
 from datetime import datetime
+from operator import itemgetter
 from zoneinfo import ZoneInfo
 import json
+import sys
 from pathlib import Path 
 from env import directory_prefix
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Resolved once; every chat and message timestamp converts to this zone
+_CST = ZoneInfo('America/Chicago')
+
+# Cleaned chat record; a tuple is far lighter than a dict per chat
+Chat = namedtuple('Chat', 'name uuid created_at updated_at bucket')
+
+# Fields pulled from each raw chat in one C-level call
+_CHAT_FIELDS = itemgetter('name', 'uuid', 'created_at', 'updated_at')
+
+# One summary block per chat, bound once so the loop only fills fields in
+_SUMMARY_BLOCK = "{name}\n{uuid}\n{msg_list}\n{msg_count}\n{create_dt}\n{update_dt}\n{file_name}\n".format_map
+
+# Archive directory under the user's home, resolved once at import
+_OUTPUT_DIR = Path.home().joinpath(*directory_prefix).resolve()
+
+def _format_cst(cst_dt):
+    """Format a CST datetime as 'YYYY-MM-DD H:MMAM/PM' without strftime"""
+    hour = cst_dt.hour
+    meridiem = 'AM' if hour < 12 else 'PM'
+    return f'{cst_dt.year:04d}-{cst_dt.month:02d}-{cst_dt.day:02d} {hour % 12 or 12}:{cst_dt.minute:02d}{meridiem}'
+
 def format_timestamp(ts_string):
     """
     Convert ISO timestamp to 'YYYY-MM-DD H:MMAM/PM' format in CST
@@ -21,17 +50,35 @@ def format_timestamp(ts_string):
         str: Formatted timestamp in CST
     """
     try:
-        dt = datetime.fromisoformat(ts_string.replace('Z', '+00:00'))
-        cst_dt = dt.astimezone(ZoneInfo('America/Chicago'))
-        return cst_dt.strftime('%Y-%m-%d %-I:%M%p')
+        iso_string = ts_string[:-1] + '+00:00' if ts_string.endswith('Z') else ts_string
+        return _format_cst(datetime.fromisoformat(iso_string).astimezone(_CST))
     except Exception as e:
         print(f"Error formatting timestamp {ts_string}: {e}")
         return ts_string
     
 def get_current_CST_timestamp(): 
     """Get current timestamp in CST formatted as 'YYYY-MM-DD H:MMAM/PM'"""
-    cst_now = datetime.now(ZoneInfo('America/Chicago'))
-    return cst_now.strftime('%Y-%m-%d %-I:%M%p')
+    return _format_cst(datetime.now(_CST))
+
+def clean_chat(chat):
+    """
+    Project one raw chat onto the fields the archive keeps
+    
+    Args:
+        chat (dict): Raw chat data from API
+        
+    Returns:
+        Chat: Cleaned chat record
+        None: if a required key is missing
+    """
+    try:
+        name, uuid, created_at, updated_at = _CHAT_FIELDS(chat)
+    except KeyError as e:
+        print(f"Warning: Missing key {e} in chat data: {chat}")
+        return None
+
+    updated_at = format_timestamp(updated_at)
+    return Chat(name, uuid, format_timestamp(created_at), updated_at, updated_at[:10])
 
 def transform_raw_chats(raw_chats):
     """
@@ -41,40 +88,20 @@ def transform_raw_chats(raw_chats):
         raw_chats (list): Raw chat data from API
         
     Returns:
-        list: Cleaned chat objects
+        tuple: (uuid of the most recently updated chat, list of Chat records)
     """
-    cleaned_chats = []
-    
-
-    most_recent_chat = None 
-    most_recent_ts = None 
-
-    for chat in raw_chats:
-
-        try:
-            cleaned_chat = {
-                'name': chat['name'], 
-                'uuid': chat['uuid'],
-                'created_at': format_timestamp(chat['created_at']),
-                'updated_at': format_timestamp(chat['updated_at']),
-                'bucket': format_timestamp(chat['updated_at'])[:10]
-            }
-            cleaned_chats.append(cleaned_chat)
-        except KeyError as e:
-            print(f"Warning: Missing key {e} in chat data: {chat}")
-            continue
-            
-
-        try: 
-            
-            if most_recent_chat is None or chat['updated_at'] > most_recent_ts:
-                most_recent_ts = chat['updated_at']
-                most_recent_chat = chat['uuid']
-        except Exception as e: 
-            print(f'Issue saving most recent conversation: {e}')
-
+    cleaned_chats = [cleaned for cleaned in map(clean_chat, raw_chats) if cleaned is not None]
 
 
+    # * only chats that survived cleaning can be the most recent one
+    # raw ISO timestamps sort chronologically as plain strings
+    kept_uuids = {chat.uuid for chat in cleaned_chats}
+    most_recent = max(
+        (chat for chat in raw_chats if chat.get('uuid') in kept_uuids),
+        key=lambda c: c['updated_at'],
+        default=None
+    )
+    most_recent_chat = most_recent['uuid'] if most_recent else None
 
     return (most_recent_chat, cleaned_chats)
 
@@ -86,7 +113,6 @@ def parse_conversation(data):
     if not data:
         return []
     
-    messages = []
     messages_key = 'chat_messages'
     
     
@@ -100,34 +126,33 @@ def parse_conversation(data):
     if not message_data: 
         return []
     
-    if isinstance(message_data, list):
-        for item in message_data:
-            if isinstance(item, dict):
-                # Extract message info
-                message_info = {
-                    'author': item.get('sender', 'unknown'),
-                    'msg': parse_message(item.get('content')),
-                    'ts': format_timestamp(item.get('created_at'))
-                }
-                messages.append(message_info)
+    if not isinstance(message_data, list):
+        return []
     
-    return messages
+    # Extract message info; the exact type check skips anything malformed
+    return [
+        {
+            'author': item.get('sender', 'unknown'),
+            'msg': parse_message(item.get('content')),
+            'ts': format_timestamp(item.get('created_at'))
+        }
+        for item in message_data
+        if type(item) is dict
+    ]
 
 def parse_message(message_list):
     # * message comes in as a list containing one obj 
-    # we loop to be safe in case it changes in the future
-    # is this any safer than just accessing [0] lol? 
+    # only the first one is used, so index it directly
 
-    for single_message_obj in message_list:
-        return single_message_obj['text']
+    return message_list[0]['text'] if message_list else None
 
-def save_chats_to_file(current_str_datetime, chats, directory_prefix='../outputs/'):
+def save_chats_to_file(current_str_datetime, chats):
     """
     Save chat data to JSON file
     
     Args:
-        chats (list): Chat data to save
-        filename (str): Output filename
+        current_str_datetime (str): Archive timestamp used in the filename
+        chats (dict): Master object with 'last_convo' and 'conversations'
         
     Returns:
         bool: True if successful, False otherwise
@@ -137,8 +162,16 @@ def save_chats_to_file(current_str_datetime, chats, directory_prefix='../outputs
     filepath = get_output_path(current_str_datetime)
 
     try:
-        with open(filepath, 'w') as f:
-            json.dump(chats, f, indent=2)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+
+        # Serialize in one call and hand the file a single large write
+        if orjson is not None:
+            payload = orjson.dumps(chats, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(chats, indent=2).encode()
+
+        with open(filepath, 'wb', buffering=1024 * 1024) as f:
+            f.write(payload)
         return True
     except Exception as e:
         print(f"Error saving to {filepath}: {e}")
@@ -155,23 +188,16 @@ def print_chat_summary(chats):
         print("No chats to display")
         return
     
-    print(f"\n✅ Found {len(chats)} chats:")
-    print("=" * 60)
+    # Collect the whole listing and write it to stdout once
+    lines = [f"\n✅ Found {len(chats)} chats:", "=" * 60]
+    lines_append = lines.append
+    
+    for chat in chats:
+        lines_append(_SUMMARY_BLOCK(ChainMap({'msg_count': len(chat['msg_list'])}, chat)))
     
-    for i, chat in enumerate(chats, 1):
-        print(chat['name'])
-        print(chat['uuid'])
-        print(chat['msg_list'])
-        print(chat['msg_#'])
-        print(chat['create_dt'])
-        print(chat['update_dt'])
-        print(chat['file_name'])
-        print()
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
 def get_output_path(current_datetime): 
 
-    home = Path.home()
-    path = home / directory_prefix[0] / directory_prefix[1] / directory_prefix[2] / directory_prefix[3]
-    filepath = path / f'{current_datetime}_claudeArchive.json'
-    return filepath 
\ No newline at end of file
+    return _OUTPUT_DIR / f'{current_datetime}_claudeArchive.json'
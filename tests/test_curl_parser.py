@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Tests for the cURL command tokenizer
+_split_curl must split exactly as shlex.split would
+"""
+
+import random
+import shlex
+import unittest
+
+from app import curl_parser
+
+
+def _shlex_result(command):
+    """shlex.split's tokens, or its ValueError message"""
+    try:
+        return shlex.split(command)
+    except ValueError as e:
+        return str(e)
+
+def _split_result(command):
+    """_split_curl's tokens, or its ValueError message"""
+    try:
+        return curl_parser._split_curl(command)
+    except ValueError as e:
+        return str(e)
+
+
+class SplitCurlParityTest(unittest.TestCase):
+
+    SAMPLES = [
+        '',
+        '   ',
+        "curl 'https://claude.ai/api/organizations/abc/chat_conversations?limit=1'",
+        "curl 'https://x' -H 'cookie: a=1; b=2' -H \"user-agent: Mozilla/5.0 (X11)\"",
+        "curl -H \"a: \\\"quoted\\\" \\\\ \\n\" https://x",
+        "a'b'\"c\"d\\ e",
+        "'' \"\" x",
+        "tab\tseparated\r\nwords",
+        "unterminated 'single",
+        'unterminated "double',
+        'ends with "escape\\',
+        'trailing backslash \\',
+    ]
+
+    def test_samples_match_shlex(self):
+        for command in self.SAMPLES:
+            with self.subTest(command=command):
+                self.assertEqual(_split_result(command), _shlex_result(command))
+
+    def test_random_commands_match_shlex(self):
+        # Small alphabet, so quotes, escapes and whitespace collide often
+        alphabet = "ab -=:;'\"\\\t\n"
+        rng = random.Random(0)
+        for _ in range(5000):
+            command = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 24)))
+            with self.subTest(command=command):
+                self.assertEqual(_split_result(command), _shlex_result(command))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Tests for chat data transformation
+Pins the (uuid, list) shape transform_raw_chats returns to app.py
+"""
+
+import contextlib
+import io
+import sys
+import types
+import unittest
+
+# env.py is local, per-user configuration and is not tracked; provide the
+# one setting data_formatter reads at import time
+sys.modules.setdefault('env', types.SimpleNamespace(directory_prefix=['claude_archive']))
+
+from app import data_formatter
+
+
+def _raw_chat(uuid, updated_at, name='chat'):
+    """Raw chat as returned by the chat_conversations endpoint"""
+    return {
+        'name': name,
+        'uuid': uuid,
+        'created_at': '2024-01-01T12:00:00.000000Z',
+        'updated_at': updated_at
+    }
+
+
+class TransformRawChatsTest(unittest.TestCase):
+
+    def test_returns_most_recent_uuid_and_chat_list(self):
+        raw_chats = [
+            _raw_chat('older', '2024-01-02T12:00:00.000000Z'),
+            _raw_chat('newest', '2024-03-05T08:30:00.000000Z'),
+            _raw_chat('middle', '2024-02-01T00:00:00.000000Z'),
+        ]
+        
+        result = data_formatter.transform_raw_chats(raw_chats)
+        
+        self.assertIsInstance(result, tuple)
+        last_convo_uuid, formatted_chats = result
+        self.assertEqual(last_convo_uuid, 'newest')
+        self.assertIsInstance(formatted_chats, list)
+        self.assertEqual([chat.uuid for chat in formatted_chats], ['older', 'newest', 'middle'])
+        self.assertTrue(all(isinstance(chat, data_formatter.Chat) for chat in formatted_chats))
+
+    def test_chat_fields_are_formatted_in_cst(self):
+        _, formatted_chats = data_formatter.transform_raw_chats([
+            _raw_chat('abc', '2024-03-05T08:30:00.000000Z', name='Notes')
+        ])
+        
+        self.assertEqual(formatted_chats[0], data_formatter.Chat(
+            'Notes', 'abc', '2024-01-01 6:00AM', '2024-03-05 2:30AM', '2024-03-05'
+        ))
+
+    def test_empty_input(self):
+        self.assertEqual(data_formatter.transform_raw_chats([]), (None, []))
+
+    def test_skipped_chat_is_never_most_recent(self):
+        broken = _raw_chat('broken', '2025-01-01T00:00:00.000000Z')
+        del broken['name']
+        
+        with contextlib.redirect_stdout(io.StringIO()):
+            last_convo_uuid, formatted_chats = data_formatter.transform_raw_chats([
+                _raw_chat('kept', '2024-01-02T12:00:00.000000Z'),
+                broken,
+            ])
+        
+        self.assertEqual(last_convo_uuid, 'kept')
+        self.assertEqual([chat.uuid for chat in formatted_chats], ['kept'])
+
+
+if __name__ == '__main__':
+    unittest.main()